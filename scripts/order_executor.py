@@ -5,98 +5,254 @@ Receives order data via stdin JSON, executes via SDK, returns result
 
 Usage:
     echo '{"asset": "ETH", "isBuy": true, ...}' | python order_executor.py
+
+Daemon mode keeps the process alive and handles one JSON request per line,
+writing one JSON response per line, so SDK imports and setup are paid once:
+    python order_executor.py --daemon
+
+Note: PythonHyperliquidClient still spawns one process per call in one-shot
+mode; daemon mode has no in-repo consumer yet. The wallet, Exchange, Info and
+mids caches and the startup warmup have no effect outside --daemon: a one-shot
+process handles a single request and exits before any cache can be hit, and
+the warmup only runs in run_daemon().
 """
+import os
 import sys
 import json
 import logging
-
-# Configure logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from math import floor, log10
+
+# Configure logging (set HYPERLIQUID_LOG_LEVEL=WARNING to silence per-order logs)
+_log_level_name = (os.environ.get('HYPERLIQUID_LOG_LEVEL') or 'INFO').strip().upper()
+_log_level = logging.getLevelName(_log_level_name)  # int for known names, str otherwise
 logging.basicConfig(
-    level=logging.INFO,
+    level=_log_level if isinstance(_log_level, int) else logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
     stream=sys.stderr
 )
 logger = logging.getLogger(__name__)
+if not isinstance(_log_level, int):
+    logger.warning("Unknown HYPERLIQUID_LOG_LEVEL %r, using INFO", _log_level_name)
 
+# orjson works on bytes directly and is several times faster than the stdlib;
+# it is optional, so fall back to json when it is not installed
 try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _loads(raw: bytes):
+    """Parse a JSON document from raw stdin bytes"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps(obj) -> bytes:
+    """Serialize an object to UTF-8 encoded JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+# Response options: SDK payloads may carry non-string keys or numpy values, and
+# the trailing newline is appended by orjson itself to avoid an extra copy
+_EMIT_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE
+    if orjson is not None else 0
+)
+
+
+def _emit(obj):
+    """Serialize a response straight to stdout as one JSON line and flush"""
+    out = sys.stdout.buffer
+    if orjson is not None:
+        out.write(orjson.dumps(obj, option=_EMIT_OPTIONS))
+    else:
+        out.write(json.dumps(obj).encode('utf-8'))
+        out.write(b"\n")
+    out.flush()
+
+
+# Error responses have a fixed shape, so only the message needs encoding
+_ERR_PREFIX = b'{"status":"error","message":'
+_ERR_SUFFIX = b'}\n'
+
+
+def _write_error(message: str):
+    """Write a {"status": "error", "message": ...} response to stdout and flush"""
+    out = sys.stdout.buffer
+    out.write(_ERR_PREFIX + _dumps(message) + _ERR_SUFFIX)
+    out.flush()
+
+
+try:
+    from eth_account import Account
     from hyperliquid.exchange import Exchange
     from hyperliquid.info import Info
-    from hyperliquid.utils import constants
+    from hyperliquid.utils import constants, signing
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
-    print(json.dumps({
-        "status": "error",
-        "message": "hyperliquid-python-sdk not installed. Run: pip install hyperliquid-python-sdk"
-    }))
+    _write_error("hyperliquid-python-sdk not installed. Run: pip install hyperliquid-python-sdk")
     sys.exit(1)
 
+# API URLs indexed by is_testnet (False -> mainnet, True -> testnet)
+_URLS = (constants.MAINNET_API_URL, constants.TESTNET_API_URL)
+
+# Client caches - reused across requests in daemon mode so repeated calls skip
+# key derivation and keep the SDK's HTTP session (keep-alive, TLS) warm.
+# Wallets are keyed by raw private-key bytes, Exchange by
+# (base_url, secret_key, account_address, use_api_wallet), Info by (base_url,).
+# Keys stay in memory for the process lifetime, as they already do inside the
+# cached wallet objects.
+_wallet_cache = {}
+_exchange_cache = {}
+_info_cache = {}
+
+# Shared pool used to overlap market-price lookups with wallet/Exchange setup
+_io_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='hl-io')
+
+# Connection pool shared by each SDK client's requests.Session. Every SDK call
+# (including /info) is a POST, so the adapter only retries connect errors - the
+# request never reached the server - and signed orders are never sent twice.
+HTTP_POOL_CONNECTIONS = 4
+HTTP_POOL_MAXSIZE = 16
+HTTP_RETRY = Retry(total=2, connect=2, read=0, backoff_factor=0.05)
+
+# all_mids() snapshot shared by back-to-back market orders. The TTL is kept well
+# below Hyperliquid's commit latency so prices are never meaningfully stale.
+MIDS_CACHE_TTL_SECONDS = 0.5
+
+
+def _tune_session(client):
+    """Mount a keep-alive connection pool with retries on an SDK client's session"""
+    session = getattr(client, 'session', None)
+    if session is None:
+        return
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=HTTP_RETRY
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
 
-def get_market_price(asset: str, is_testnet: bool = False) -> float:
+
+def _get_info(base_url: str) -> Info:
+    """Return a cached Info client for the given API URL"""
+    key = (base_url,)
+    info = _info_cache.get(key)
+    if info is None:
+        info = Info(base_url, skip_ws=True)
+        _tune_session(info)
+        _info_cache[key] = info
+    return info
+
+
+def _wallet(secret_hex: str):
+    """Return the LocalAccount for a hex private key, deriving it only once per process"""
+    key = bytes.fromhex(secret_hex)
+    wallet = _wallet_cache.get(key)
+    if wallet is None:
+        wallet = Account.from_key(key)
+        _wallet_cache[key] = wallet
+    return wallet
+
+
+def _new_exchange(base_url: str, secret_key: str, account_address: str, use_api_wallet: bool) -> Exchange:
+    """Construct an Exchange client (fetches asset metadata) with tuned sessions"""
+    wallet = _wallet(secret_key)
+
+    # Exchange constructor: Exchange(wallet, base_url, vault_address=None, account_address=None)
+    # When using API wallet, account_address should be the main account we're trading on behalf of
+    # vault_address is only for actual vault trading (multi-user vaults)
+    if use_api_wallet:
+        # API wallet: wallet is the API wallet, account_address is the main account
+        # Note: use account_address parameter, NOT vault_address
+        exchange = Exchange(wallet, base_url, account_address=account_address)
+        logger.debug("Exchange initialized with API wallet, account_address=%s", account_address)
+    else:
+        # Main wallet: no vault or account_address needed
+        exchange = Exchange(wallet, base_url)
+        logger.debug("Exchange initialized with main wallet")
+
+    # Exchange builds its own Info for metadata lookups - tune both sessions
+    _tune_session(exchange)
+    _tune_session(getattr(exchange, 'info', None))
+    return exchange
+
+
+def _get_exchange(is_testnet: bool, secret_key: str, account_address: str, use_api_wallet: bool,
+                  coins=()) -> Exchange:
     """
-    Get current market price for an asset from Hyperliquid
+    Return a cached Exchange client for the given credentials
+
+    The Exchange resolves coin names with metadata fetched at construction, so a
+    cached client is rebuilt when it does not know one of the requested coins
+    (e.g. an asset listed after the daemon started).
 
     Args:
-        asset: Coin name (e.g., "ETH", "BTC")
         is_testnet: True for testnet, False for mainnet
+        secret_key: Private key without 0x prefix
+        account_address: Main account address
+        use_api_wallet: True when secret_key belongs to an API wallet trading
+            on behalf of account_address
+        coins: Coin names the caller is about to trade or cancel
 
     Returns:
-        float: Current mid price
+        Exchange: SDK exchange client
     """
-    base_url = constants.TESTNET_API_URL if is_testnet else constants.MAINNET_API_URL
-    info = Info(base_url, skip_ws=True)
+    base_url = _URLS[bool(is_testnet)]
+    key = (base_url, secret_key, account_address, use_api_wallet)
+    exchange = _exchange_cache.get(key)
+    if exchange is not None:
+        missing = [coin for coin in coins if coin not in exchange.info.name_to_coin]
+        if not missing:
+            return exchange
+        logger.info("Refreshing exchange metadata for unknown coin(s): %s", ", ".join(missing))
 
-    # Get all mids (mid prices for all assets)
-    all_mids = info.all_mids()
+    exchange = _new_exchange(base_url, secret_key, account_address, use_api_wallet)
+    _exchange_cache[key] = exchange
 
-    if asset in all_mids:
-        price = float(all_mids[asset])
-        logger.info(f"Market price for {asset}: {price}")
-        return price
-    else:
-        raise ValueError(f"Asset {asset} not found in market data")
+    missing = [coin for coin in coins if coin not in exchange.info.name_to_coin]
+    if missing:
+        raise ValueError(f"Unknown asset: {', '.join(missing)}")
+    return exchange
 
 
-def execute_order(data: dict) -> dict:
+def _resolve_credentials(data: dict) -> tuple:
     """
-    Execute an order on Hyperliquid via the official SDK
+    Resolve and validate signing credentials from request data (no network calls)
 
     Args:
-        data: Dictionary containing order parameters:
-            - asset: Coin name (e.g., "ETH", "BTC")
-            - isBuy: True for buy, False for sell
-            - size: Order size as string
-            - price: Limit price as string (optional - if not provided, uses market price)
-            - reduceOnly: Boolean for reduce-only orders
-            - timeInForce: TIF setting ("Gtc", "Ioc", "Alo")
-            - orderType: "MARKET", "LIMIT", or "TRIGGER" (for stop-loss)
-            - triggerPx: Trigger price for TRIGGER orders (required if orderType=TRIGGER)
-            - tpsl: "sl" for stop-loss, "tp" for take-profit (required if orderType=TRIGGER)
+        data: Request dictionary containing:
             - isTestnet: True for testnet, False for mainnet
             - hyperliquidAddress: Main account address
+            - apiWalletPrivateKey: API wallet private key (optional, preferred)
             - hyperliquidPrivateKey: Main account private key (if not using API wallet)
-            - apiWalletPrivateKey: API wallet private key (optional)
 
     Returns:
-        dict: Hyperliquid API response
+        tuple: (is_testnet, secret_key, account_address, use_api_wallet) - the
+            arguments of _get_exchange, with the 0x prefix stripped from secret_key
     """
-    # Determine API URL
     is_testnet = data.get('isTestnet', True)
-    base_url = constants.TESTNET_API_URL if is_testnet else constants.MAINNET_API_URL
-
-    logger.info(f"Using {'TESTNET' if is_testnet else 'MAINNET'} API: {base_url}")
+    account_address = data['hyperliquidAddress']
 
     # Configure credentials
-    # API Wallet: use api_wallet_private_key but main account address as vault
+    # API Wallet: sign with the API wallet key, trade on behalf of the main account
     api_wallet_key = data.get('apiWalletPrivateKey')
 
     if api_wallet_key:
         secret_key = api_wallet_key
-        # For API wallet, we trade on behalf of the main account
-        account_address = data['hyperliquidAddress']
-        logger.info(f"Using API Wallet to trade on behalf of: {account_address}")
+        logger.debug("Using API Wallet to trade on behalf of: %s", account_address)
     else:
         secret_key = data.get('hyperliquidPrivateKey')
-        account_address = data['hyperliquidAddress']
-        logger.info(f"Using main wallet: {account_address}")
+        logger.debug("Using main wallet: %s", account_address)
 
     if not secret_key:
         raise ValueError("No private key provided (neither apiWalletPrivateKey nor hyperliquidPrivateKey)")
@@ -105,36 +261,155 @@ def execute_order(data: dict) -> dict:
     if secret_key.startswith('0x'):
         secret_key = secret_key[2:]
 
-    # Initialize SDK
-    logger.info("Initializing Hyperliquid SDK...")
+    try:
+        bytes.fromhex(secret_key)
+    except ValueError:
+        raise ValueError("Private key is not a valid hex string") from None
 
-    # Exchange constructor: Exchange(wallet, base_url, vault_address=None, account_address=None)
-    # When using API wallet, account_address should be the main account we're trading on behalf of
-    # vault_address is only for actual vault trading (multi-user vaults)
-    from eth_account import Account
-    wallet = Account.from_key(secret_key)
+    return is_testnet, secret_key, account_address, bool(api_wallet_key)
 
-    if api_wallet_key:
-        # API wallet: wallet is the API wallet, account_address is the main account
-        # Note: use account_address parameter, NOT vault_address
-        exchange = Exchange(wallet, base_url, account_address=account_address)
-        logger.info(f"Exchange initialized with API wallet, account_address={account_address}")
+
+def _build_exchange(data: dict, coins=()) -> tuple:
+    """
+    Resolve credentials from request data and return the matching Exchange
+
+    Args:
+        data: Request dictionary with credentials (see _resolve_credentials)
+        coins: Coin names the request trades or cancels (see _get_exchange)
+
+    Returns:
+        tuple: (Exchange, account_address)
+    """
+    credentials = _resolve_credentials(data)
+    exchange = _get_exchange(*credentials, coins)
+    return exchange, credentials[2]
+
+
+# Known tick sizes expressed as decimal places (ETH tick = 0.1 -> 1, BTC tick = 1.0 -> 0)
+# Hyperliquid requires prices to be divisible by tick size
+TICK_DECIMALS = {
+    'BTC': 0,
+    'ETH': 1,
+    'SOL': 2,
+    'AVAX': 2,
+    'DOGE': 5,
+    'XRP': 4,
+    'MATIC': 4,
+    'ARB': 4,
+    'OP': 3,
+    'LINK': 3,
+}
+
+# Hyperliquid perp price precision: at most 5 significant figures and at most
+# MAX_PERP_DECIMALS - szDecimals decimal places; integer prices are always valid.
+# See https://hyperliquid.gitbook.io/hyperliquid-docs/for-developers/api/tick-and-lot-size
+PRICE_SIG_FIGS = 5
+MAX_PERP_DECIMALS = 6
+
+
+def _sz_decimals(info: Info, asset: str) -> int:
+    """Size decimals (szDecimals) for a coin from the exchange's asset metadata"""
+    return info.asset_to_sz_decimals[info.name_to_asset(asset)]
+
+
+def _round_price(price: float, asset: str, sz_decimals: int) -> float:
+    """
+    Round a price to a value Hyperliquid accepts for the asset
+
+    Args:
+        price: Raw price (must be positive)
+        asset: Coin name, used to apply a known tick size
+        sz_decimals: The asset's szDecimals, which caps price decimals
+
+    Returns:
+        float: Price with at most 5 significant figures, snapped to the tick size when known
+    """
+    if price <= 0:
+        raise ValueError(f"Invalid price for {asset}: {price}")
+
+    max_decimals = max(0, MAX_PERP_DECIMALS - sz_decimals)
+    digits = min(max_decimals, max(0, PRICE_SIG_FIGS - 1 - floor(log10(price))))
+    price = round(price, digits)
+
+    decimals = TICK_DECIMALS.get(asset)
+    if decimals is not None and decimals < digits:
+        price = round(price, decimals)
+    return price
+
+
+@lru_cache(maxsize=4)
+def _all_mids(base_url: str, time_bucket: int) -> dict:
+    """
+    Fetch mid prices for all assets, cached per API URL and time bucket
+
+    time_bucket advances every MIDS_CACHE_TTL_SECONDS, so a snapshot is reused
+    for at most that long; the small maxsize evicts expired buckets.
+    """
+    return _get_info(base_url).all_mids()
+
+
+def get_market_price(asset: str, is_testnet: bool = False) -> float:
+    """
+    Get current market price for an asset from Hyperliquid
+
+    Args:
+        asset: Coin name (e.g., "ETH", "BTC")
+        is_testnet: True for testnet, False for mainnet
+
+    Returns:
+        float: Current mid price
+    """
+    return _mid_price(_current_mids(is_testnet), asset)
+
+
+def _current_mids(is_testnet: bool) -> dict:
+    """Get all mids (mid prices for all assets), reusing a recent snapshot"""
+    base_url = _URLS[bool(is_testnet)]
+    return _all_mids(base_url, int(time.monotonic() / MIDS_CACHE_TTL_SECONDS))
+
+
+def _mid_price(all_mids: dict, asset: str) -> float:
+    """Read one asset's mid price from an all_mids snapshot"""
+    if asset in all_mids:
+        price = float(all_mids[asset])
+        logger.debug("Market price for %s: %s", asset, price)
+        return price
     else:
-        # Main wallet: no vault or account_address needed
-        exchange = Exchange(wallet, base_url)
-        logger.info(f"Exchange initialized with main wallet")
+        raise ValueError(f"Asset {asset} not found in market data")
 
+
+def _needs_market_price(order: dict) -> bool:
+    """True when the order is priced from the market (MARKET order or no price given)"""
+    return order.get('orderType', 'LIMIT').upper() == 'MARKET' or not order.get('price')
+
+
+def _build_order_request(order: dict, is_testnet: bool, info: Info, market_price: float = None) -> dict:
+    """
+    Translate one order from request data into an SDK order request
+
+    Args:
+        order: Dictionary containing order parameters (asset, isBuy, size, price,
+            reduceOnly, timeInForce, orderType, triggerPx, tpsl) - see execute_order
+        is_testnet: True for testnet, False for mainnet (used for market price lookup)
+        info: The exchange's Info client, used for the asset's szDecimals
+        market_price: Mid price already fetched for the asset (optional)
+
+    Returns:
+        dict: Order request with coin, is_buy, sz, limit_px, order_type, reduce_only
+    """
     # Extract order parameters
-    asset = data['asset']
-    is_buy = data['isBuy']
-    size = float(data['size'])
-    reduce_only = data.get('reduceOnly', False)
-    order_type_str = data.get('orderType', 'LIMIT').upper()
+    asset = order['asset']
+    is_buy = order['isBuy']
+    size = float(order['size'])
+    reduce_only = order.get('reduceOnly', False)
+    order_type_str = order.get('orderType', 'LIMIT').upper()
+    sz_decimals = _sz_decimals(info, asset)
 
     # Determine price - use market price for MARKET orders or if no price provided
-    if order_type_str == 'MARKET' or not data.get('price'):
+    if _needs_market_price(order):
         # Get current market price
-        market_price = get_market_price(asset, is_testnet)
+        if market_price is None:
+            market_price = get_market_price(asset, is_testnet)
 
         # For market orders, add slippage tolerance (0.5% for buys, -0.5% for sells)
         # This ensures IOC orders execute immediately
@@ -144,46 +419,24 @@ def execute_order(data: dict) -> dict:
         else:
             price = market_price * (1 - slippage)  # Accept slightly less to ensure fill
 
-        logger.info(f"Using market price {market_price} with slippage -> {price}")
+        logger.debug("Using market price %s with slippage -> %s", market_price, price)
     else:
-        price = float(data['price'])
-
-    # Round price to tick size (ETH tick = 0.1, BTC tick = 1.0, etc.)
-    # Hyperliquid requires prices to be divisible by tick size
-    tick_sizes = {
-        'BTC': 1.0,
-        'ETH': 0.1,
-        'SOL': 0.01,
-        'AVAX': 0.01,
-        'DOGE': 0.00001,
-        'XRP': 0.0001,
-        'MATIC': 0.0001,
-        'ARB': 0.0001,
-        'OP': 0.001,
-        'LINK': 0.001,
-    }
-    tick_size = tick_sizes.get(asset, 0.01)  # Default tick size
-    price = round(price / tick_size) * tick_size
-    # Round to avoid floating point errors
-    decimals = len(str(tick_size).split('.')[-1]) if '.' in str(tick_size) else 0
-    price = round(price, decimals)
+        price = float(order['price'])
+
+    price = _round_price(price, asset, sz_decimals)
 
     # Build order type based on orderType parameter
     if order_type_str == 'TRIGGER':
         # TRIGGER order for stop-loss or take-profit
         # Uses trigger price to activate, then executes as market order
-        trigger_px = data.get('triggerPx')
+        trigger_px = order.get('triggerPx')
         if not trigger_px:
             raise ValueError("triggerPx is required for TRIGGER orders")
 
         # Convert trigger price to float (SDK expects numeric, not string)
-        trigger_px_float = float(trigger_px)
-
-        # Round trigger price to tick size
-        trigger_px_float = round(trigger_px_float / tick_size) * tick_size
-        trigger_px_float = round(trigger_px_float, decimals)
+        trigger_px_float = _round_price(float(trigger_px), asset, sz_decimals)
 
-        tpsl = data.get('tpsl', 'sl')  # 'sl' for stop-loss, 'tp' for take-profit
+        tpsl = order.get('tpsl', 'sl')  # 'sl' for stop-loss, 'tp' for take-profit
 
         order_type = {
             "trigger": {
@@ -192,80 +445,171 @@ def execute_order(data: dict) -> dict:
                 "tpsl": tpsl
             }
         }
-        logger.info(f"Placing TRIGGER order: {asset} {'BUY' if is_buy else 'SELL'} {size} @ {price} (trigger={trigger_px_float}, tpsl={tpsl}, reduce_only={reduce_only})")
+        logger.info("Placing TRIGGER order: %s %s %s @ %s (trigger=%s, tpsl=%s, reduce_only=%s)",
+                    asset, 'BUY' if is_buy else 'SELL', size, price, trigger_px_float, tpsl, reduce_only)
     else:
         # Regular LIMIT or MARKET order
-        tif = 'Ioc' if order_type_str == 'MARKET' else data.get('timeInForce', 'Gtc')
+        tif = 'Ioc' if order_type_str == 'MARKET' else order.get('timeInForce', 'Gtc')
         order_type = {"limit": {"tif": tif}}
-        logger.info(f"Placing order: {asset} {'BUY' if is_buy else 'SELL'} {size} @ {price} (reduce_only={reduce_only}, tif={tif}, type={order_type_str})")
+        logger.info("Placing order: %s %s %s @ %s (reduce_only=%s, tif=%s, type=%s)",
+                    asset, 'BUY' if is_buy else 'SELL', size, price, reduce_only, tif, order_type_str)
+
+    return {
+        "coin": asset,
+        "is_buy": is_buy,
+        "sz": size,
+        "limit_px": price,
+        "order_type": order_type,
+        "reduce_only": reduce_only,
+    }
+
+
+def execute_order(data: dict) -> dict:
+    """
+    Execute an order on Hyperliquid via the official SDK
+
+    Args:
+        data: Dictionary containing order parameters:
+            - asset: Coin name (e.g., "ETH", "BTC")
+            - isBuy: True for buy, False for sell
+            - size: Order size as string
+            - price: Limit price as string (optional - if not provided, uses market price)
+            - reduceOnly: Boolean for reduce-only orders
+            - timeInForce: TIF setting ("Gtc", "Ioc", "Alo")
+            - orderType: "MARKET", "LIMIT", or "TRIGGER" (for stop-loss)
+            - triggerPx: Trigger price for TRIGGER orders (required if orderType=TRIGGER)
+            - tpsl: "sl" for stop-loss, "tp" for take-profit (required if orderType=TRIGGER)
+            - isTestnet: True for testnet, False for mainnet
+            - hyperliquidAddress: Main account address
+            - hyperliquidPrivateKey: Main account private key (if not using API wallet)
+            - apiWalletPrivateKey: API wallet private key (optional)
+
+    Returns:
+        dict: Hyperliquid API response
+    """
+    # Determine API URL
+    is_testnet = data.get('isTestnet', True)
+    base_url = _URLS[bool(is_testnet)]
+
+    logger.debug("Using %s API: %s", 'TESTNET' if is_testnet else 'MAINNET', base_url)
+
+    # Validate the request before any network work, so a rejected request
+    # returns (and a one-shot process exits) without waiting on a price fetch
+    credentials = _resolve_credentials(data)
+    asset = data['asset']
+
+    # Start the market price lookup so it overlaps with SDK initialization
+    price_future = None
+    if _needs_market_price(data):
+        price_future = _io_executor.submit(get_market_price, asset, is_testnet)
+
+    # Initialize SDK (cached across requests)
+    exchange = _get_exchange(*credentials, (asset,))
+
+    market_price = price_future.result() if price_future is not None else None
+    order_request = _build_order_request(data, is_testnet, exchange.info, market_price)
+    price = order_request['limit_px']
 
     # Place order - SDK 0.21+ uses positional args: (name, is_buy, sz, px, order_type, reduce_only)
     result = exchange.order(
-        asset,          # coin/name
-        is_buy,         # is_buy
-        size,           # sz
-        price,          # limit_px
-        order_type,     # order_type
-        reduce_only     # reduce_only
+        order_request['coin'],          # coin/name
+        order_request['is_buy'],        # is_buy
+        order_request['sz'],            # sz
+        price,                          # limit_px
+        order_request['order_type'],    # order_type
+        order_request['reduce_only']    # reduce_only
     )
 
-    logger.info(f"Order result: {result}")
+    logger.info("Order result: %s", result)
 
     # Add execution price to result for SL calculation
     # The price used in order is the limit price (with slippage for MARKET orders)
     if isinstance(result, dict):
         result['executionPrice'] = str(price)
-        logger.info(f"Added executionPrice={price} to result")
+        logger.debug("Added executionPrice=%s to result", price)
 
     return result
 
 
-def cancel_order(data: dict) -> dict:
+def execute_bulk_orders(data: dict) -> dict:
     """
-    Cancel an order on Hyperliquid
+    Execute several orders on Hyperliquid in a single signed action
 
     Args:
         data: Dictionary containing:
-            - asset: Coin name
-            - orderId: Order ID to cancel
+            - orders: List of order dictionaries, each with the order parameters
+              accepted by execute_order (asset, isBuy, size, price, ...)
             - isTestnet: True for testnet, False for mainnet
             - hyperliquidAddress: Main account address
             - apiWalletPrivateKey or hyperliquidPrivateKey
 
     Returns:
-        dict: Hyperliquid API response
+        dict: Hyperliquid API response, one status per order in request order
     """
+    orders = data.get('orders')
+    if not orders:
+        raise ValueError("orders is required for bulk_order")
+
     is_testnet = data.get('isTestnet', True)
-    base_url = constants.TESTNET_API_URL if is_testnet else constants.MAINNET_API_URL
 
-    api_wallet_key = data.get('apiWalletPrivateKey')
-    if api_wallet_key:
-        secret_key = api_wallet_key
-        account_address = data['hyperliquidAddress']
-    else:
-        secret_key = data.get('hyperliquidPrivateKey')
-        account_address = data['hyperliquidAddress']
+    # Validate the request before any network work (see execute_order)
+    credentials = _resolve_credentials(data)
+    coins = {order['asset'] for order in orders}
 
-    if secret_key.startswith('0x'):
-        secret_key = secret_key[2:]
+    # Fetch one mids snapshot while the SDK initializes; every market-priced
+    # order in the batch is priced from that same snapshot
+    mids_future = None
+    if any(_needs_market_price(order) for order in orders):
+        mids_future = _io_executor.submit(_current_mids, is_testnet)
 
-    from eth_account import Account
-    wallet = Account.from_key(secret_key)
+    # Initialize SDK (cached across requests)
+    exchange = _get_exchange(*credentials, coins)
 
-    if api_wallet_key:
-        exchange = Exchange(wallet, base_url, account_address=account_address)
-    else:
-        exchange = Exchange(wallet, base_url)
+    all_mids = mids_future.result() if mids_future is not None else None
+
+    order_requests = []
+    for order in orders:
+        market_price = _mid_price(all_mids, order['asset']) if _needs_market_price(order) else None
+        order_requests.append(_build_order_request(order, is_testnet, exchange.info, market_price))
+
+    # Sign and submit all orders in one action (one network round-trip)
+    result = exchange.bulk_orders(order_requests)
+
+    logger.info("Bulk order result: %s", result)
+
+    # Add execution prices (same order as the request) for SL calculation
+    if isinstance(result, dict):
+        result['executionPrices'] = [str(req['limit_px']) for req in order_requests]
+
+    return result
+
+
+def cancel_order(data: dict) -> dict:
+    """
+    Cancel an order on Hyperliquid
+
+    Args:
+        data: Dictionary containing:
+            - asset: Coin name
+            - orderId: Order ID to cancel
+            - isTestnet: True for testnet, False for mainnet
+            - hyperliquidAddress: Main account address
+            - apiWalletPrivateKey or hyperliquidPrivateKey
+
+    Returns:
+        dict: Hyperliquid API response
+    """
+    exchange, _ = _build_exchange(data, (data['asset'],))
 
     asset = data['asset']
     order_id = data['orderId']
 
-    logger.info(f"Cancelling order {order_id} for {asset}")
+    logger.info("Cancelling order %s for %s", order_id, asset)
 
     # SDK cancel uses positional args: (name, oid)
     result = exchange.cancel(asset, order_id)
 
-    logger.info(f"Cancel result: {result}")
+    logger.info("Cancel result: %s", result)
     return result
 
 
@@ -282,16 +626,16 @@ def get_positions(data: dict) -> dict:
         dict: Position information
     """
     is_testnet = data.get('isTestnet', True)
-    base_url = constants.TESTNET_API_URL if is_testnet else constants.MAINNET_API_URL
+    base_url = _URLS[bool(is_testnet)]
 
     account_address = data['hyperliquidAddress']
 
-    logger.info(f"Getting positions for {account_address}")
+    logger.debug("Getting positions for %s", account_address)
 
-    info = Info(base_url, skip_ws=True)
+    info = _get_info(base_url)
     user_state = info.user_state(account_address)
 
-    logger.info(f"User state retrieved")
+    logger.debug("User state retrieved")
     return user_state
 
 
@@ -308,61 +652,112 @@ def get_open_orders(data: dict) -> list:
         list: Open orders
     """
     is_testnet = data.get('isTestnet', True)
-    base_url = constants.TESTNET_API_URL if is_testnet else constants.MAINNET_API_URL
+    base_url = _URLS[bool(is_testnet)]
 
     account_address = data['hyperliquidAddress']
 
-    logger.info(f"Getting open orders for {account_address}")
+    logger.debug("Getting open orders for %s", account_address)
 
-    info = Info(base_url, skip_ws=True)
+    info = _get_info(base_url)
     open_orders = info.open_orders(account_address)
 
-    logger.info(f"Found {len(open_orders)} open orders")
+    logger.debug("Found %d open orders", len(open_orders))
     return open_orders
 
 
+def dispatch(input_data: dict):
+    """Route a parsed request to the handler for its action"""
+    action = input_data.get('action', 'order')
+
+    if action == 'order':
+        return execute_order(input_data)
+    elif action == 'bulk_order':
+        return execute_bulk_orders(input_data)
+    elif action == 'cancel':
+        return cancel_order(input_data)
+    elif action == 'positions':
+        return get_positions(input_data)
+    elif action == 'open_orders':
+        return get_open_orders(input_data)
+    else:
+        raise ValueError(f"Unknown action: {action}")
+
+
+# Minimal order action used only to exercise the signing path during warmup
+_WARMUP_ACTION = {
+    "type": "order",
+    "orders": [{"a": 0, "b": True, "p": "1", "s": "1", "r": False, "t": {"limit": {"tif": "Gtc"}}}],
+    "grouping": "na",
+}
+
+
+def _warmup():
+    """
+    Derive a throwaway key and sign a dummy order action through the SDK's
+    EIP-712 L1 signing path (action hashing, typed-data encoding, signing) so
+    that setup is not paid by the first real order. The signature is never
+    sent - no network calls are made; failures are logged and ignored.
+    """
+    try:
+        wallet = Account.from_key("0x" + "11" * 32)
+        # sign_l1_action(wallet, action, active_pool, nonce, expires_after, is_mainnet)
+        signing.sign_l1_action(wallet, _WARMUP_ACTION, None, 0, None, True)
+    except Exception:
+        logger.debug("Warmup failed", exc_info=True)
+
+
+def run_daemon():
+    """
+    Persistent worker loop - reads newline-delimited JSON requests from stdin
+    and writes one newline-delimited JSON response per request to stdout.
+    Errors are reported per request and never terminate the loop.
+    """
+    _warmup()
+    logger.info("Order executor daemon started")
+
+    for line in sys.stdin.buffer:
+        if not line.strip():
+            continue
+
+        # Serialization happens inside the try so an unencodable result is
+        # reported as an error response (nothing is written until it succeeds)
+        try:
+            _emit(dispatch(_loads(line)))
+        except json.JSONDecodeError as e:
+            _write_error(f"Invalid JSON input: {str(e)}")
+        except Exception as e:
+            logger.exception("Error executing action")
+            _write_error(str(e))
+
+    logger.info("stdin closed, order executor daemon exiting")
+
+
 def main():
     """Main entry point - reads JSON from stdin and executes requested action"""
+    if '--daemon' in sys.argv[1:]:
+        run_daemon()
+        return
+
     try:
         # Read input from stdin
-        input_text = sys.stdin.read()
-        if not input_text.strip():
+        raw_input = sys.stdin.buffer.read()
+        if not raw_input.strip():
             raise ValueError("No input provided via stdin")
 
-        input_data = json.loads(input_text)
+        input_data = _loads(raw_input)
 
-        # Determine action
-        action = input_data.get('action', 'order')
-
-        if action == 'order':
-            result = execute_order(input_data)
-        elif action == 'cancel':
-            result = cancel_order(input_data)
-        elif action == 'positions':
-            result = get_positions(input_data)
-        elif action == 'open_orders':
-            result = get_open_orders(input_data)
-        else:
-            raise ValueError(f"Unknown action: {action}")
+        result = dispatch(input_data)
 
         # Output result as JSON
-        print(json.dumps(result))
+        _emit(result)
 
     except json.JSONDecodeError as e:
-        error_response = {
-            "status": "error",
-            "message": f"Invalid JSON input: {str(e)}"
-        }
-        print(json.dumps(error_response))
+        _write_error(f"Invalid JSON input: {str(e)}")
         sys.exit(1)
 
     except Exception as e:
         logger.exception("Error executing action")
-        error_response = {
-            "status": "error",
-            "message": str(e)
-        }
-        print(json.dumps(error_response))
+        _write_error(str(e))
         sys.exit(1)
 
 
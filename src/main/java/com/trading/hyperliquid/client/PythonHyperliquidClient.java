@@ -288,6 +288,13 @@ public class PythonHyperliquidClient {
      */
     @SuppressWarnings("unchecked")
     private Map<String, Object> executePythonScript(Map<String, Object> input) throws HyperliquidApiException {
+        return executePythonScript(input, Map.class);
+    }
+
+    /**
+     * Execute the Python script with given input and parse the result as the given type
+     */
+    private <T> T executePythonScript(Map<String, Object> input, Class<T> responseType) throws HyperliquidApiException {
         String inputJson;
         try {
             inputJson = objectMapper.writeValueAsString(input);
@@ -363,7 +370,7 @@ public class PythonHyperliquidClient {
             }
 
             // Parse JSON response
-            return objectMapper.readValue(stdout, Map.class);
+            return objectMapper.readValue(stdout, responseType);
 
         } catch (IOException e) {
             log.error("Failed to execute Python script", e);
@@ -503,44 +510,9 @@ public class PythonHyperliquidClient {
             input.put("isTestnet", user.getIsTestnet());
             input.put("hyperliquidAddress", user.getHyperliquidAddress());
 
-            String inputJson = objectMapper.writeValueAsString(input);
-            log.debug("Python script input: {}", inputJson);
-
-            ProcessBuilder pb = new ProcessBuilder("python", PYTHON_SCRIPT);
-            pb.directory(new File(System.getProperty("user.dir")));
-            pb.redirectErrorStream(false);
-
-            Process process = pb.start();
-
-            try (OutputStream stdin = process.getOutputStream()) {
-                stdin.write(inputJson.getBytes(StandardCharsets.UTF_8));
-                stdin.flush();
-            }
-
-            boolean completed = process.waitFor(SCRIPT_TIMEOUT_SECONDS, TimeUnit.SECONDS);
-
-            if (!completed) {
-                process.destroyForcibly();
-                throw new HyperliquidApiException("Python script timed out");
-            }
-
-            String stdout;
-            try (BufferedReader reader = new BufferedReader(
-                    new InputStreamReader(process.getInputStream(), StandardCharsets.UTF_8))) {
-                StringBuilder sb = new StringBuilder();
-                String line;
-                while ((line = reader.readLine()) != null) {
-                    sb.append(line);
-                }
-                stdout = sb.toString();
-            }
-
-            if (process.exitValue() != 0 || stdout.isEmpty()) {
-                throw new HyperliquidApiException("Python script failed");
-            }
-
+            List<Map<String, Object>> openOrders = executePythonScript(input, List.class);
             log.info("Open orders retrieved successfully");
-            return objectMapper.readValue(stdout, List.class);
+            return openOrders;
 
         } catch (Exception e) {
             log.error("Failed to get open orders via Python SDK", e);